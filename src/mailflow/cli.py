@@ -22,6 +22,9 @@ from mailflow.process import process as process_email
 
 logger = logging.getLogger(__name__)
 
+# Entity and document type codes become directory and workflow name components
+_CODE_RE = re.compile(r"^[a-z0-9_-]+$")
+
 def _write_empty_workflows(workflows_file: Path) -> None:
     workflows_file.parent.mkdir(parents=True, exist_ok=True)
     payload = {"schema_version": WORKFLOWS_SCHEMA_VERSION, "workflows": []}
@@ -154,7 +157,7 @@ def _interactive_workflow_setup(config: Config, data_store: DataStore) -> tuple[
             break
 
         # Validate entity code
-        if not re.match(r'^[a-z0-9_-]+$', entity_code):
+        if not _CODE_RE.match(entity_code):
             click.echo("  ✗ Entity code must contain only lowercase letters, numbers, hyphens, and underscores")
             continue
 
@@ -191,7 +194,7 @@ def _interactive_workflow_setup(config: Config, data_store: DataStore) -> tuple[
             break
 
         # Validate doc code
-        if not re.match(r'^[a-z0-9_-]+$', doc_code):
+        if not _CODE_RE.match(doc_code):
             click.echo("  ✗ Document type must contain only lowercase letters, numbers, hyphens, and underscores")
             continue
 
@@ -259,8 +259,23 @@ def register(cli):
         stats = {"processed": 0, "auto": 0, "skipped": 0, "errors": 0}
         total = len(email_files)
 
-        for i, (email_file, email_content, email_data) in enumerate(
-            zip(email_files, email_contents, email_data_list), 1
+        # Check processed state for the whole batch over one connection. The
+        # snapshot predates this run, so a message repeated within the batch is
+        # checked against the tracker again once its first copy has been handled.
+        if force:
+            processed_infos = [None] * total
+        else:
+            processed_infos = tracker.get_processed_info_many(
+                [
+                    (content, data.get("message_id"))
+                    for content, data in zip(email_contents, email_data_list, strict=True)
+                ]
+            )
+        seen_contents: set[str] = set()
+        seen_message_ids: set[str] = set()
+
+        for i, (email_file, email_content, email_data, processed_info) in enumerate(
+            zip(email_files, email_contents, email_data_list, processed_infos, strict=True), 1
         ):
             try:
                 if not email_content:
@@ -268,12 +283,16 @@ def register(cli):
                     continue
 
                 message_id = email_data.get("message_id")
-
-                if not force and tracker.is_processed(email_content, message_id):
+                if not force and not processed_info and (
+                    email_content in seen_contents or (message_id and message_id in seen_message_ids)
+                ):
                     processed_info = tracker.get_processed_info(email_content, message_id)
-                    prev_workflow = (
-                        processed_info.get("workflow_name", "unknown") if processed_info else "unknown"
-                    )
+                seen_contents.add(email_content)
+                if message_id:
+                    seen_message_ids.add(message_id)
+
+                if processed_info:
+                    prev_workflow = processed_info.get("workflow_name", "unknown")
                     click.echo(f"[{i}/{total}] SKIP {email_file.name}: Already processed ({prev_workflow})")
                     stats["skipped"] += 1
                     continue
@@ -286,14 +305,17 @@ def register(cli):
                     "_workflow_filter": workflow_filter,
                 }
 
-                # Process one email through standard pipeline
+                # Process one email through standard pipeline, reusing the
+                # pre-extracted data instead of parsing the message again
                 await process_email(
                     email_content,
                     config=config,
                     force=force,
                     dry_run=dry_run,
                     context=context,
-                    interactive=interactive
+                    interactive=interactive,
+                    email_data=email_data or None,
+                    data_store=data_store,
                 )
                 stats["processed"] += 1
             except SystemExit as e:
@@ -13,19 +13,67 @@ class GlobalIndex:
     def __init__(self, indexes_path: str):
         self.indexes_path = Path(indexes_path).expanduser().resolve()
         self.indexes_path.mkdir(parents=True, exist_ok=True)
+        # Connection targets as plain strings, built once rather than per connect
+        self._meta_db_path = str(self.indexes_path / "metadata.db")
+        self._fts_db_path = str(self.indexes_path / "fts.db")
+        # (metadata, fts) connections shared while inside batch()
+        self._batch_conns: tuple[sqlite3.Connection, sqlite3.Connection] | None = None
         self._init_dbs()
 
     @property
     def meta_db(self) -> Path:
-        return self.indexes_path / "metadata.db"
+        return Path(self._meta_db_path)
 
     @property
     def fts_db(self) -> Path:
-        return self.indexes_path / "fts.db"
+        return Path(self._fts_db_path)
+
+    @contextmanager
+    def batch(self):
+        """Share one connection per database and commit once on exit.
+
+        Upserts made inside the block skip their per-call connect/commit, so a
+        full re-index is one transaction per database instead of one per row.
+        Rolls back both databases if the block raises.
+
+        The two commits are not atomic as a pair. The search index commits
+        first: if the metadata commit then fails, the extra search rows have
+        no metadata row, so search() skips them, and they are replaced when
+        those documents are indexed again.
+        """
+        if self._batch_conns is not None:
+            yield self
+            return
+
+        meta = sqlite3.connect(self._meta_db_path)
+        meta.row_factory = sqlite3.Row
+        fts = sqlite3.connect(self._fts_db_path)
+        fts.row_factory = sqlite3.Row
+        self._batch_conns = (meta, fts)
+        try:
+            yield self
+            fts.commit()
+            meta.commit()
+        except BaseException:
+            meta.rollback()
+            fts.rollback()
+            raise
+        finally:
+            self._batch_conns = None
+            meta.close()
+            fts.close()
+
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        # Inside batch() the commit happens once, when the block exits
+        if self._batch_conns is None:
+            conn.commit()
 
     @contextmanager
     def _conn(self):
-        conn = sqlite3.connect(str(self.meta_db))
+        if self._batch_conns is not None:
+            yield self._batch_conns[0]
+            return
+        conn = sqlite3.connect(self._meta_db_path)
         try:
             conn.row_factory = sqlite3.Row
             yield conn
@@ -34,7 +82,10 @@ class GlobalIndex:
 
     @contextmanager
     def _fts_conn(self):
-        conn = sqlite3.connect(str(self.fts_db))
+        if self._batch_conns is not None:
+            yield self._batch_conns[1]
+            return
+        conn = sqlite3.connect(self._fts_db_path)
         try:
             conn.row_factory = sqlite3.Row
             yield conn
@@ -134,7 +185,7 @@ class GlobalIndex:
                 "SELECT id FROM documents WHERE entity=? AND rel_path=?",
                 (data["entity"], data["rel_path"]),
             ).fetchone()[0]
-            conn.commit()
+            self._commit(conn)
             return int(doc_id)
 
     def upsert_stream(self, data: Dict[str, Any]) -> int:
@@ -152,7 +203,7 @@ class GlobalIndex:
                 "SELECT id FROM streams WHERE entity=? AND rel_path=?",
                 (data["entity"], data["rel_path"]),
             ).fetchone()[0]
-            conn.commit()
+            self._commit(conn)
             return int(sid)
 
     def add_link(self, stream_id: int, document_id: int) -> None:
@@ -161,7 +212,7 @@ class GlobalIndex:
                 "INSERT OR IGNORE INTO links(stream_id, document_id) VALUES(?, ?)",
                 (stream_id, document_id),
             )
-            conn.commit()
+            self._commit(conn)
 
     def upsert_fts(self, doc_id: int, filename: str, email_subject: str, email_from: str, search_content: str) -> None:
         with self._fts_conn() as conn:
@@ -173,7 +224,7 @@ class GlobalIndex:
                 "INSERT INTO pdf_search(rowid, filename, email_subject, email_from, search_content) VALUES(?,?,?,?,?)",
                 (doc_id, filename, email_subject, email_from, search_content),
             )
-            conn.commit()
+            self._commit(conn)
 
     # Query
     def search(self, query: str, limit: int = 20, *, entity: Optional[str] = None, source: Optional[str] = None, workflow: Optional[str] = None, category: Optional[str] = None) -> Iterable[Dict[str, Any]]:
@@ -5,9 +5,12 @@ from typing import Optional
 
 from mailflow.global_index import GlobalIndex
 
+_DATE_PREFIX_RE = re.compile(r"(\d{4}-\d{2}-\d{2})-")
+_DOC_LINK_RE = re.compile(r"\((\.\./)+docs/\d{4}/[^)]+\)")
+
 
 def _extract_date_from_name(name: str) -> str:
-    m = re.match(r"(\d{4}-\d{2}-\d{2})-", name)
+    m = _DATE_PREFIX_RE.match(name)
     return m.group(1) if m else "1970-01-01"
 
 
@@ -21,6 +24,12 @@ def run_indexer(base_path: str, indexes_path: Optional[str] = None) -> int:
         indexes_path = str(base / "indexes")
     gi = GlobalIndex(indexes_path)
 
+    with gi.batch():
+        return _index_archive(gi, base)
+
+
+def _index_archive(gi: GlobalIndex, base: Path) -> int:
+    """Index every entity under base into gi; returns the number of documents."""
     count = 0
 
     # Iterate entities (directories in base)
@@ -108,7 +117,7 @@ def run_indexer(base_path: str, indexes_path: Optional[str] = None) -> int:
                             # Link docs referenced in transcript
                             try:
                                 text = md_path.read_text()
-                                for match in re.findall(r"\((\.\./)+docs/\d{4}/[^)]+\)", text):
+                                for match in _DOC_LINK_RE.findall(text):
                                     # normalize rel path from entity_dir
                                     # remove leading ../../..
                                     link = match.strip("()")
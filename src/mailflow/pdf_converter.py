@@ -6,6 +6,7 @@ import base64
 import html
 import logging
 import os
+import re
 from datetime import datetime
 from email.message import Message
 from pathlib import Path
@@ -20,6 +21,9 @@ from mailflow.security import validate_path
 
 logger = logging.getLogger(__name__)
 
+# Links in plain-text bodies are turned into anchors for the PDF rendering
+_URL_RE = re.compile(r'(https?://[^\s<>"{}|\\^`\[\]]+)')
+
 
 def text_to_pdf_bytes(text: str) -> bytes:
     """Convert plain text to a minimal PDF and return bytes.
@@ -136,10 +140,7 @@ def extract_best_html_from_message(message_obj: Message) -> tuple[str, bool]:
         # Basic HTML conversion preserving structure
         escaped = html.escape(plain_content)
         # Convert URLs to links
-        import re
-
-        url_pattern = r'(https?://[^\s<>"{}|\\^`\[\]]+)'
-        escaped = re.sub(url_pattern, r'<a href="\1">\1</a>', escaped)
+        escaped = _URL_RE.sub(r'<a href="\1">\1</a>', escaped)
         # Convert newlines to <br>
         escaped = escaped.replace("\n", "<br>\n")
 
@@ -431,22 +432,22 @@ def save_email_as_pdf(
 
         # Generate filename from template
         from_domain = email_data.get("features", {}).get("from_domain", "unknown")
-        date_str = datetime.now().strftime("%Y%m%d")
 
-        # Parse date from email if available
+        # Parse date from email if available, falling back to the current time
         email_date = None
         if email_data.get("date"):
             try:
                 from email.utils import parsedate_to_datetime
 
                 email_date = parsedate_to_datetime(email_data["date"])
-                date_str = email_date.strftime("%Y%m%d")
             except:
                 email_date = None
 
         if not email_date:
             email_date = datetime.now()
-            date_str = email_date.strftime("%Y%m%d")
+        # Format the date once; the compact form is derived from the ISO one
+        date_prefix = email_date.date().isoformat()
+        date_str = date_prefix.replace("-", "")
 
         # Create year directory if requested
         dir_path = base_dir / str(email_date.year) if use_year_dirs else base_dir
@@ -454,7 +455,6 @@ def save_email_as_pdf(
         dir_path.mkdir(parents=True, exist_ok=True)
 
         # Build filename with date prefix
-        date_prefix = email_date.strftime("%Y-%m-%d")
         filename_parts = {
             "date": date_str,
             "from": from_domain,
@@ -26,6 +26,8 @@ async def process(
     dry_run: bool = False,
     context: dict | None = None,
     interactive: bool = False,
+    email_data: dict | None = None,
+    data_store: DataStore | None = None,
 ) -> None:
     """
     Process an email message through the mailflow workflow.
@@ -38,6 +40,10 @@ async def process(
         dry_run: Preview mode - don't execute or store anything
         context: Optional extra context to merge into email_data (e.g., _position, _total, _thread_info)
         interactive: If True, prompt user to validate classification; if False, accept automatically
+        email_data: Optional data already extracted from message (e.g., by batch pre-scan);
+            skips re-parsing the message. A shallow copy is used, the caller's dict is not modified.
+        data_store: Optional already-loaded workflow store to reuse across calls (e.g., batch)
+            instead of re-reading and validating workflows.json for every message
     """
     try:
         # Initialize components
@@ -56,14 +62,17 @@ async def process(
         if llm_model is not None:
             config.settings["llm"]["model_alias"] = llm_model
 
-        extractor = EmailExtractor()
-        data_store = DataStore(config)
+        if data_store is None:
+            data_store = DataStore(config)
 
         ui = WorkflowSelector(config, data_store, interactive=interactive)
 
-        # Extract email data
-        logger.debug("Extracting email features")
-        email_data = extractor.extract(message)
+        # Extract email data, unless the caller already did
+        if email_data is None:
+            logger.debug("Extracting email features")
+            email_data = EmailExtractor().extract(message)
+        else:
+            email_data = dict(email_data)
 
         # Merge optional context (e.g., batch position, thread info)
         if context:
@@ -73,7 +82,8 @@ async def process(
         logger.info(f"Processing email from {email_data.get('from', 'unknown')}")
 
         # Check if already processed (unless force)
-        if not force and tracker.is_processed(message, message_id):
+        # One lookup both answers "processed?" and fetches the details
+        if not force:
             processed_info = tracker.get_processed_info(message, message_id)
             if processed_info:
                 prev_workflow = processed_info.get("workflow_name", "unknown")
@@ -11,6 +11,9 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Initial key for the hash cache; never identical to any content passed in
+_MISSING = object()
+
 
 class ProcessedEmailsTracker:
     """
@@ -33,6 +36,9 @@ class ProcessedEmailsTracker:
         """
         self.config = config
         self.db_path = config.config_dir / "processed_emails.db"
+        # One-entry hash cache: a message is typically checked, then marked
+        self._last_hashed_content: object = _MISSING
+        self._last_content_hash = ""
         self._init_database()
 
     def _init_database(self):
@@ -99,13 +105,19 @@ class ProcessedEmailsTracker:
         """
         Calculate SHA-256 hash of email content.
 
+        The digest of the most recently hashed content is reused, so checking
+        and then marking the same message encodes and hashes it only once.
+
         Args:
             email_content: Raw email content
 
         Returns:
             64-character hex string (SHA-256 hash)
         """
-        return hashlib.sha256(email_content.encode("utf-8")).hexdigest()
+        if email_content is not self._last_hashed_content:
+            self._last_content_hash = hashlib.sha256(email_content.encode("utf-8")).hexdigest()
+            self._last_hashed_content = email_content
+        return self._last_content_hash
 
     def mark_as_processed(
         self, email_content: str, message_id: str | None, workflow_name: str
@@ -155,8 +167,6 @@ class ProcessedEmailsTracker:
         Returns:
             True if email has been processed before
         """
-        content_hash = self._calculate_content_hash(email_content)
-
         try:
             with self.get_connection() as conn:
                 # First try message-id lookup if available
@@ -171,7 +181,7 @@ class ProcessedEmailsTracker:
                 # Fall back to content hash lookup
                 result = conn.execute(
                     "SELECT COUNT(*) as count FROM processed_emails WHERE email_hash = ?",
-                    (content_hash,),
+                    (self._calculate_content_hash(email_content),),
                 )
                 return result.fetchone()["count"] > 0
 
@@ -179,6 +189,40 @@ class ProcessedEmailsTracker:
             logger.error(f"Failed to check if processed: {e}")
             return False
 
+    def _lookup(
+        self, conn: sqlite3.Connection, email_content: str, message_id: str | None
+    ) -> dict[str, Any] | None:
+        """Find the processed row for an email: message-id first, then content hash."""
+        # Try message-id first if available
+        if message_id:
+            result = conn.execute(
+                """
+                SELECT workflow_name, processed_at, message_id, email_hash
+                FROM processed_emails
+                WHERE message_id = ?
+                ORDER BY processed_at DESC
+                LIMIT 1
+                """,
+                (message_id,),
+            )
+            row = result.fetchone()
+            if row:
+                return dict(row)
+
+        # Fall back to content hash
+        result = conn.execute(
+            """
+            SELECT workflow_name, processed_at, message_id, email_hash
+            FROM processed_emails
+            WHERE email_hash = ?
+            ORDER BY processed_at DESC
+            LIMIT 1
+            """,
+            (self._calculate_content_hash(email_content),),
+        )
+        row = result.fetchone()
+        return dict(row) if row else None
+
     def get_processed_info(
         self, email_content: str, message_id: str | None
     ) -> dict[str, Any] | None:
@@ -192,44 +236,40 @@ class ProcessedEmailsTracker:
         Returns:
             Dict with workflow_name, processed_at, etc. or None if not processed
         """
-        content_hash = self._calculate_content_hash(email_content)
-
         try:
             with self.get_connection() as conn:
-                # Try message-id first if available
-                if message_id:
-                    result = conn.execute(
-                        """
-                        SELECT workflow_name, processed_at, message_id, email_hash
-                        FROM processed_emails
-                        WHERE message_id = ?
-                        ORDER BY processed_at DESC
-                        LIMIT 1
-                        """,
-                        (message_id,),
-                    )
-                    row = result.fetchone()
-                    if row:
-                        return dict(row)
-
-                # Fall back to content hash
-                result = conn.execute(
-                    """
-                    SELECT workflow_name, processed_at, message_id, email_hash
-                    FROM processed_emails
-                    WHERE email_hash = ?
-                    ORDER BY processed_at DESC
-                    LIMIT 1
-                    """,
-                    (content_hash,),
-                )
-                row = result.fetchone()
-                return dict(row) if row else None
+                return self._lookup(conn, email_content, message_id)
 
         except Exception as e:
             logger.error(f"Failed to get processed info: {e}")
             return None
 
+    def get_processed_info_many(
+        self, emails: list[tuple[str, str | None]]
+    ) -> list[dict[str, Any] | None]:
+        """
+        Get information about several emails over a single database connection.
+
+        Matches like get_processed_info; meant for batch runs that check every
+        message up front instead of opening a connection per message.
+
+        Args:
+            emails: List of (email_content, message_id) pairs
+
+        Returns:
+            List aligned with emails: info dict, or None if not processed
+        """
+        try:
+            with self.get_connection() as conn:
+                return [
+                    self._lookup(conn, email_content, message_id)
+                    for email_content, message_id in emails
+                ]
+
+        except Exception as e:
+            logger.error(f"Failed to get processed info: {e}")
+            return [None] * len(emails)
+
     def get_statistics(self) -> dict[str, Any]:
         """
         Get statistics about processed emails.
@@ -4,8 +4,29 @@
 
 import os
 import re
+import string
 from pathlib import Path
 
+# Compiled once at import; these run for every email and attachment processed
+_ANGLE_ADDRESS_RE = re.compile(r"<([^>]+)>")
+# Local part: cannot start/end with dot, dots must be separated by other chars
+# Domain part: cannot start/end with dot, dots must be separated by other chars
+_EMAIL_RE = re.compile(
+    r"^[a-zA-Z0-9_%+-]+(?:\.[a-zA-Z0-9_%+-]+)*@[a-zA-Z0-9-]+(?:\.[a-zA-Z0-9-]+)*\.[a-zA-Z]{2,}$"
+)
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9._-]")
+_SAFE_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + "._-")
+# ASCII fast path for sanitize_filename: one C-level pass instead of a regex scan
+_FILENAME_TRANSLATION = str.maketrans(
+    {chr(i): "-" for i in range(128) if chr(i) not in _SAFE_FILENAME_CHARS}
+)
+_UNSAFE_SHELL_CHARS_RE = re.compile(r"[^a-zA-Z0-9._@/-]")
+_INVALID_MESSAGE_ID_CHARS_RE = re.compile(r"[^a-zA-Z0-9@._-]")
+# ASCII fast path for validate_message_id: delete disallowed characters in one pass
+_MESSAGE_ID_DELETIONS = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if chr(i) not in _SAFE_FILENAME_CHARS | {"@"})
+)
+
 
 class SecurityError(Exception):
     """Base exception for security violations"""
@@ -115,19 +136,15 @@ def validate_email_address(email: str) -> str:
         return ""
 
     # Extract email from "Name <email@domain>" format
-    match = re.search(r"<([^>]+)>", email)
+    match = _ANGLE_ADDRESS_RE.search(email)
     email_part = match.group(1) if match else email.strip()
 
     # Check for consecutive dots anywhere in the email
     if ".." in email_part:
         raise InputValidationError("Invalid email address format")
 
-    # Email regex that prevents leading/trailing dots in local and domain parts
-    # Local part: cannot start/end with dot, dots must be separated by other chars
-    # Domain part: cannot start/end with dot, dots must be separated by other chars
-    email_pattern = r"^[a-zA-Z0-9_%+-]+(?:\.[a-zA-Z0-9_%+-]+)*@[a-zA-Z0-9-]+(?:\.[a-zA-Z0-9-]+)*\.[a-zA-Z]{2,}$"
-
-    if not re.match(email_pattern, email_part):
+    # Email regex prevents leading/trailing dots in local and domain parts
+    if not _EMAIL_RE.match(email_part):
         # Don't reveal the exact email in error message
         raise InputValidationError("Invalid email address format")
 
@@ -151,7 +168,10 @@ def sanitize_filename(filename: str) -> str:
     filename = os.path.basename(filename)
 
     # Replace dangerous characters
-    safe_filename = re.sub(r"[^a-zA-Z0-9._-]", "-", filename)
+    if filename.isascii():
+        safe_filename = filename.translate(_FILENAME_TRANSLATION)
+    else:
+        safe_filename = _UNSAFE_FILENAME_CHARS_RE.sub("-", filename)
 
     # Limit length
     max_length = 255
@@ -178,7 +198,7 @@ def sanitize_shell_arg(arg: str) -> str:
     """
     # This is only for display purposes
     # NEVER use this for actual shell execution
-    return re.sub(r"[^a-zA-Z0-9._@/-]", "_", arg)
+    return _UNSAFE_SHELL_CHARS_RE.sub("_", arg)
 
 
 def validate_json_size(json_path: Path, max_size_mb: int = 10) -> None:
@@ -216,7 +236,10 @@ def validate_message_id(message_id: str) -> str:
         return ""
 
     # Message IDs should only contain certain characters
-    sanitized = re.sub(r"[^a-zA-Z0-9@._-]", "", message_id)
+    if message_id.isascii():
+        sanitized = message_id.translate(_MESSAGE_ID_DELETIONS)
+    else:
+        sanitized = _INVALID_MESSAGE_ID_CHARS_RE.sub("", message_id)
 
     # Limit length
     if len(sanitized) > 200:
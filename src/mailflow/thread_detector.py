@@ -4,7 +4,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThreadInfo:
     """Information about an email's position in a thread."""
     position: int  # 1-indexed position in thread
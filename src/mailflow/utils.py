@@ -2,6 +2,7 @@
 # ABOUTME: Provides file locking, safe writes, hashing, and retry logic.
 """Utility functions for mailflow"""
 
+import functools
 import hashlib
 import json
 import logging
@@ -18,32 +19,50 @@ from mailflow.exceptions import DataError
 logger = logging.getLogger(__name__)
 
 
-def atomic_write(filepath: Path, content: str, mode: str = "w") -> None:
+def _sync_data(fd: int) -> None:
+    """Flush file contents to disk, using fdatasync where the platform has it."""
+    # fdatasync skips flushing metadata such as mtime; macOS only has fsync
+    getattr(os, "fdatasync", os.fsync)(fd)
+
+
+def atomic_write(filepath: Path, content: str, mode: str = "w", *, fsync: bool = True) -> None:
     """
     Write file atomically to prevent data corruption.
 
     Args:
         filepath: Target file path
         content: Content to write
-        mode: File mode ('w' or 'wb')
+        mode: File mode ('w' writes content as UTF-8, 'wb' writes bytes)
+        fsync: Flush the data to disk before the rename. With False the
+            rename is still atomic, but a crash can leave an empty or
+            truncated file; use only for data that can be regenerated.
 
     Raises:
         DataError: If write fails
     """
     filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
+    parent = filepath.parent
+    prefix = f".{filepath.name}."
 
-    # Create temp file in same directory (for same filesystem)
-    temp_fd, temp_path = tempfile.mkstemp(
-        dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp"
-    )
+    # Create temp file in same directory (for same filesystem). The parent
+    # usually exists, so only pay for mkdir when mkstemp says it is missing.
+    try:
+        temp_fd, temp_path = tempfile.mkstemp(dir=parent, prefix=prefix, suffix=".tmp")
+    except FileNotFoundError:
+        parent.mkdir(parents=True, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=parent, prefix=prefix, suffix=".tmp")
 
     try:
-        # Write to temp file
-        with os.fdopen(temp_fd, mode) as f:
-            f.write(content)
-            f.flush()
-            os.fsync(f.fileno())  # Force write to disk
+        # Write straight to the descriptor; no buffered file object needed
+        try:
+            data = content.encode("utf-8") if "b" not in mode else content
+            view = memoryview(data)
+            while view:
+                view = view[os.write(temp_fd, view):]
+            if fsync:
+                _sync_data(temp_fd)  # Force write to disk
+        finally:
+            os.close(temp_fd)
 
         # Atomic rename
         os.replace(temp_path, filepath)
@@ -58,20 +77,21 @@ def atomic_write(filepath: Path, content: str, mode: str = "w") -> None:
         )
 
 
-def atomic_json_write(filepath: Path, data: Any, **json_kwargs) -> None:
+def atomic_json_write(filepath: Path, data: Any, *, fsync: bool = True, **json_kwargs) -> None:
     """
     Write JSON file atomically.
 
     Args:
         filepath: Target file path
         data: Data to serialize to JSON
+        fsync: Flush the data to disk before the rename (see atomic_write)
         **json_kwargs: Additional arguments for json.dump
     """
     json_kwargs.setdefault("indent", 2)
     json_kwargs.setdefault("sort_keys", True)
 
     content = json.dumps(data, **json_kwargs)
-    atomic_write(filepath, content)
+    atomic_write(filepath, content, fsync=fsync)
 
 
 def safe_json_load(filepath: Path, default: Any = None) -> Any:
@@ -162,14 +182,10 @@ def calculate_file_hash(filepath: Path, algorithm: str = "sha256") -> str:
     Returns:
         Hex digest of file hash
     """
-    hash_func = hashlib.new(algorithm)
-
+    # file_digest streams through a reusable buffer (or a zero-copy fast path
+    # for real files) and releases the GIL while OpenSSL hashes the data.
     with open(filepath, "rb") as f:
-        # Read in chunks to handle large files
-        for chunk in iter(lambda: f.read(65536), b""):
-            hash_func.update(chunk)
-
-    return hash_func.hexdigest()
+        return hashlib.file_digest(f, algorithm).hexdigest()
 
 
 def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
@@ -236,6 +252,24 @@ def retry_operation(
     raise last_exception
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_base_path(base_path: str) -> Path:
+    """Resolve an (already user-expanded, absolute) archive base path once per process.
+
+    resolve() stats every path component, and the configured base path does
+    not change while mailflow runs. Callers must pass an absolute path: a
+    relative key would go stale if the working directory changed.
+    """
+    return Path(base_path).resolve()
+
+
+def _now():
+    """Current local time; the fallback year for originals, patched in tests."""
+    from datetime import datetime
+
+    return datetime.now()
+
+
 def write_original_file(
     base_path: str,
     entity: str,
@@ -249,34 +283,48 @@ def write_original_file(
     Returns absolute path as string. Best-effort; raises on fatal I/O errors.
     """
     from datetime import datetime
-    from pathlib import Path
 
-    base = Path(base_path).expanduser().resolve()
-    year = created_at.strftime("%Y") if isinstance(created_at, datetime) else datetime.now().strftime("%Y")
+    base = _resolve_base_path(os.path.abspath(os.path.expanduser(base_path)))
+    if not isinstance(created_at, datetime):
+        created_at = None
+    # Plain attribute/isoformat access avoids strftime format parsing
+    year = str((created_at or _now()).year)
     originals_dir = base / entity / "originals" / year
-    originals_dir.mkdir(parents=True, exist_ok=True)
 
     name = original_filename
-    if prefix_date and isinstance(created_at, datetime):
-        date_str = created_at.strftime("%Y-%m-%d")
+    if prefix_date and created_at is not None:
+        date_str = created_at.date().isoformat()
         # Avoid double prefix
         if not name.startswith(date_str):
             name = f"{date_str}-" + name
 
-    out_path = originals_dir / name
-    # Handle collisions by suffixing -2, -3, ...
-    if out_path.exists():
-        stem = out_path.stem
-        suffix = out_path.suffix
-        i = 2
-        while True:
-            candidate = originals_dir / f"{stem}-{i}{suffix}"
-            if not candidate.exists():
-                out_path = candidate
-                break
-            i += 1
-
-    with open(out_path, "wb") as f:
+    out_path, fd = _claim_unique_path(originals_dir, name)
+    with os.fdopen(fd, "wb") as f:
         f.write(content)
 
     return str(out_path)
+
+
+def _claim_unique_path(directory: Path, name: str) -> tuple[Path, int]:
+    """Create a new file named name (or name-2, name-3, ...) in directory.
+
+    Returns the path and an open write-only descriptor the caller must close.
+    """
+    # Claim the name with an exclusive create: one syscall per attempt, and no
+    # window between checking and creating. The directory exists for all but
+    # the first original of the year, so only create it when the open fails.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    out_path = directory / name
+    stem = out_path.stem
+    suffix = out_path.suffix
+    i = 1
+    while True:
+        try:
+            return out_path, os.open(out_path, flags, 0o666)
+        except FileExistsError:
+            i += 1
+            out_path = directory / f"{stem}-{i}{suffix}"
+        except FileNotFoundError:
+            if directory.is_dir():
+                raise
+            directory.mkdir(parents=True, exist_ok=True)
@@ -1,6 +1,7 @@
 # ABOUTME: Workflow action implementations for mailflow email processing.
 # ABOUTME: Provides functions to save attachments, create PDFs, and generate todos from emails.
 import datetime
+import functools
 import logging
 import os
 from pathlib import Path
@@ -9,14 +10,53 @@ from typing import Any
 from mailflow.attachment_handler import extract_attachments
 from mailflow.exceptions import WorkflowError
 from mailflow.llmemory_indexer import run_indexing
-from mailflow.pdf_converter import email_to_pdf_bytes
 from mailflow.security import validate_path
 from mailflow.utils import write_original_file
-from mailflow.attachment_conversion import convert_attachment
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_created_at(date_header: str | None) -> datetime.datetime:
+    """Parse an email Date header into a timezone-aware UTC datetime.
+
+    Naive dates are taken as UTC; a missing or unparseable header falls back
+    to the current time.
+    """
+    if date_header:
+        from email.utils import parsedate_to_datetime
+
+        try:
+            dt = parsedate_to_datetime(date_header)
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=datetime.timezone.utc)
+            return dt.astimezone(datetime.timezone.utc)
+        except Exception:
+            pass
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _get_writer(base_path: str, entity: str):
+    """Return a RepositoryWriter for (base_path, entity), built once per process.
+
+    The writer's config, entity and source are fixed, so batch runs reuse one
+    instance instead of rebuilding it for every message.
+    """
+    # Expand ~ before the cache lookup so a changed HOME never gets a writer
+    # bound to the previous home directory
+    return _cached_writer(os.path.expanduser(base_path), entity)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_writer(base_path: str, entity: str):
+    from docflow_archive import RepositoryWriter, RepositoryConfig
+
+    return RepositoryWriter(
+        config=RepositoryConfig(base_path=base_path),
+        entity=entity,
+        source="mail",
+    )
+
+
 def save_attachment(
     message: dict[str, Any],
     workflow: str,
@@ -40,37 +80,14 @@ def save_attachment(
         dict with success status and saved documents
     """
     try:
-        from email.utils import parsedate_to_datetime
-
-        from docflow_archive import RepositoryWriter, RepositoryConfig
-
         if not entity:
             raise WorkflowError("Workflow handling missing archive.entity")
 
-        # Parse created_at from email Date header (source timestamp)
-        # Must be timezone-aware and UTC-normalized
-        created_at = None
-        if message.get("date"):
-            try:
-                dt = parsedate_to_datetime(message["date"])
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=datetime.timezone.utc)
-                created_at = dt.astimezone(datetime.timezone.utc)
-            except Exception:
-                pass
-        if created_at is None:
-            created_at = datetime.datetime.now(datetime.timezone.utc)
+        # Source timestamp from the email Date header
+        created_at = _parse_created_at(message.get("date"))
 
         archive_cfg = config.settings.get("archive", {})
-        archive_config = RepositoryConfig(
-            base_path=archive_cfg.get("base_path", "~/Archive"),
-        )
-
-        writer = RepositoryWriter(
-            config=archive_config,
-            entity=entity,
-            source="mail"
-        )
+        writer = _get_writer(archive_cfg.get("base_path", "~/Archive"), entity)
 
         message_obj = message.get("_message_obj")
         if not message_obj:
@@ -80,7 +97,7 @@ def save_attachment(
         attachments = extract_attachments(message_obj, pattern=pattern)
 
         if not attachments:
-            logger.info(f"No attachments matching '{pattern}' found")
+            logger.info("No attachments matching '%s' found", pattern)
             return {
                 "success": True,
                 "count": 0,
@@ -90,12 +107,15 @@ def save_attachment(
         # Save each attachment
         results = []
         convert_flag = archive_cfg.get("convert_attachments", False)
+        if convert_flag:
+            # Deferred: conversion pulls in the Playwright-based PDF renderer
+            from mailflow.attachment_conversion import convert_attachment
         for filename, content, mimetype in attachments:
             if convert_flag:
                 try:
                     mimetype, content, filename = convert_attachment(filename, mimetype, content)
                 except Exception as e:
-                    logger.warning(f"Attachment conversion failed for {filename}: {e}")
+                    logger.warning("Attachment conversion failed for %s: %s", filename, e)
             subdirectory = directory
             if not subdirectory:
                 raise WorkflowError("Workflow handling missing archive.doctype")
@@ -117,7 +137,7 @@ def save_attachment(
                 original_filename=filename,
                 subdirectory=subdirectory
             )
-            logger.info(f"Saved attachment {filename} to {content_path}")
+            logger.info("Saved attachment %s to %s", filename, content_path)
 
             if index_llmemory:
                 # Index to llmemory (fail-fast if not configured)
@@ -148,9 +168,9 @@ def save_attachment(
                         prefix_date=archive_cfg.get("originals_prefix_date", False),
                     )
                 except Exception as e:
-                    logger.warning(f"Failed to write original '{filename}': {e}")
+                    logger.warning("Failed to write original '%s': %s", filename, e)
 
-        logger.info(f"Saved {len(results)} attachment(s)")
+        logger.info("Saved %d attachment(s)", len(results))
         return {
             "success": True,
             "count": len(results),
@@ -193,7 +213,9 @@ def create_todo(message: dict[str, Any], todo_file: str = "~/todos.txt"):
         with open(todo_path, "a", encoding="utf-8") as f:
             f.write(todo_entry)
 
-        logger.info(f"Created todo for message {message_id} at {todo_path}: {todo_entry.strip()}")
+        logger.info(
+            "Created todo for message %s at %s: %s", message_id, todo_path, todo_entry.strip()
+        )
 
     except Exception as e:
         raise WorkflowError(
@@ -225,37 +247,17 @@ def save_email_pdf(
         dict with document_id, content_path, success status
     """
     try:
-        from email.utils import parsedate_to_datetime
-
-        from docflow_archive import RepositoryWriter, RepositoryConfig
+        # Deferred: pdf_converter pulls in Playwright and BeautifulSoup
+        from mailflow.pdf_converter import email_to_pdf_bytes
 
         if not entity:
             raise WorkflowError("Workflow handling missing archive.entity")
 
-        # Parse created_at from email Date header (source timestamp)
-        # Must be timezone-aware and UTC-normalized
-        created_at = None
-        if message.get("date"):
-            try:
-                dt = parsedate_to_datetime(message["date"])
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=datetime.timezone.utc)
-                created_at = dt.astimezone(datetime.timezone.utc)
-            except Exception:
-                pass
-        if created_at is None:
-            created_at = datetime.datetime.now(datetime.timezone.utc)
+        # Source timestamp from the email Date header
+        created_at = _parse_created_at(message.get("date"))
 
         archive_cfg = config.settings.get("archive", {})
-        archive_config = RepositoryConfig(
-            base_path=archive_cfg.get("base_path", "~/Archive"),
-        )
-
-        writer = RepositoryWriter(
-            config=archive_config,
-            entity=entity,
-            source="mail"
-        )
+        writer = _get_writer(archive_cfg.get("base_path", "~/Archive"), entity)
 
         message_obj = message.get("_message_obj")
         if not message_obj:
@@ -286,7 +288,7 @@ def save_email_pdf(
             original_filename=document_name,
             subdirectory=subdirectory
         )
-        logger.info(f"Converted email to PDF at {content_path}")
+        logger.info("Converted email to PDF at %s", content_path)
 
         if index_llmemory:
             # Index to llmemory (fail-fast if not configured)
@@ -340,37 +342,17 @@ def save_pdf(
         dict with document_id, content_path, success status
     """
     try:
-        from email.utils import parsedate_to_datetime
-
-        from docflow_archive import RepositoryWriter, RepositoryConfig
+        # Deferred: pdf_converter pulls in Playwright and BeautifulSoup
+        from mailflow.pdf_converter import email_to_pdf_bytes
 
         if not entity:
             raise WorkflowError("Workflow handling missing archive.entity")
 
-        # Parse created_at from email Date header (source timestamp)
-        # Must be timezone-aware and UTC-normalized
-        created_at = None
-        if message.get("date"):
-            try:
-                dt = parsedate_to_datetime(message["date"])
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=datetime.timezone.utc)
-                created_at = dt.astimezone(datetime.timezone.utc)
-            except Exception:
-                pass
-        if created_at is None:
-            created_at = datetime.datetime.now(datetime.timezone.utc)
+        # Source timestamp from the email Date header
+        created_at = _parse_created_at(message.get("date"))
 
         archive_cfg = config.settings.get("archive", {})
-        archive_config = RepositoryConfig(
-            base_path=archive_cfg.get("base_path", "~/Archive"),
-        )
-
-        writer = RepositoryWriter(
-            config=archive_config,
-            entity=entity,
-            source="mail"
-        )
+        writer = _get_writer(archive_cfg.get("base_path", "~/Archive"), entity)
 
         message_obj = message.get("_message_obj")
         if not message_obj:
@@ -381,7 +363,7 @@ def save_pdf(
 
         if pdf_attachments:
             # Save PDF attachments
-            logger.info(f"Found {len(pdf_attachments)} PDF attachment(s)")
+            logger.info("Found %d PDF attachment(s)", len(pdf_attachments))
             results = []
             for filename, content, mimetype in pdf_attachments:
                 subdirectory = directory
@@ -405,7 +387,7 @@ def save_pdf(
                     original_filename=filename,
                     subdirectory=subdirectory
                 )
-                logger.info(f"Saved PDF attachment to {content_path}")
+                logger.info("Saved PDF attachment to %s", content_path)
 
                 if index_llmemory:
                     # Index to llmemory (fail-fast if not configured)
@@ -436,7 +418,7 @@ def save_pdf(
                             prefix_date=archive_cfg.get("originals_prefix_date", False),
                         )
                     except Exception as e:
-                        logger.warning(f"Failed to write original '{filename}': {e}")
+                        logger.warning("Failed to write original '%s': %s", filename, e)
 
             return {
                 "success": True,
@@ -470,7 +452,7 @@ def save_pdf(
                 original_filename=document_name,
                 subdirectory=subdirectory
             )
-            logger.info(f"Converted email to PDF at {content_path}")
+            logger.info("Converted email to PDF at %s", content_path)
 
             if index_llmemory:
                 # Index to llmemory (fail-fast if not configured)
@@ -0,0 +1,86 @@
+# ABOUTME: Tests for the batch command that processes a directory of .eml files
+# ABOUTME: Covers duplicate detection and the summary counts it reports
+"""Tests for mailflow batch"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from mailflow.cli import cli
+from mailflow.config import Config
+from mailflow.processed_emails_tracker import ProcessedEmailsTracker
+
+SAMPLE_EMAIL = """From: test@example.com
+To: user@test.com
+Subject: Test Email
+Date: Mon, 01 Jan 2024 12:00:00 +0000
+Message-ID: <batch123@example.com>
+
+This is the email body content.
+"""
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """Point every XDG directory at a temporary home with an empty workflows file"""
+    for var, name in [
+        ("XDG_CONFIG_HOME", ".config"),
+        ("XDG_DATA_HOME", ".local/share"),
+        ("XDG_STATE_HOME", ".local/state"),
+        ("XDG_CACHE_HOME", ".cache"),
+    ]:
+        monkeypatch.setenv(var, str(tmp_path / name))
+    config = Config()
+    config.get_workflows_file().write_text('{"schema_version": 1, "workflows": []}')
+    return config
+
+
+class TestBatchDeduplication:
+    """Test that batch skips messages that were already processed"""
+
+    def test_duplicate_within_one_run_is_skipped(self, config, tmp_path):
+        """A message repeated in the directory is processed once and skipped once"""
+        mail_dir = tmp_path / "mail"
+        mail_dir.mkdir()
+        (mail_dir / "a.eml").write_text(SAMPLE_EMAIL)
+        (mail_dir / "b.eml").write_text(SAMPLE_EMAIL)
+
+        async def fake_process(email_content, **kwargs):
+            # Stand in for a successful workflow run, which records the message
+            message_id = kwargs["email_data"]["message_id"]
+            ProcessedEmailsTracker(kwargs["config"]).mark_as_processed(
+                email_content, message_id, "test-workflow"
+            )
+
+        with patch(
+            "mailflow.commands.gmail_batch_workflows.process_email",
+            new_callable=AsyncMock,
+            side_effect=fake_process,
+        ) as mock_process:
+            result = CliRunner().invoke(cli, ["batch", str(mail_dir)])
+
+        assert result.exit_code == 0, result.output
+        assert mock_process.await_count == 1
+        assert "Already processed (test-workflow)" in result.output
+        assert "Processed: 1" in result.output
+        assert "Already processed (skipped): 1" in result.output
+
+    def test_previously_processed_message_is_skipped(self, config, tmp_path):
+        """Messages recorded by an earlier run are skipped without processing"""
+        mail_dir = tmp_path / "mail"
+        mail_dir.mkdir()
+        (mail_dir / "a.eml").write_text(SAMPLE_EMAIL)
+        ProcessedEmailsTracker(config).mark_as_processed(
+            SAMPLE_EMAIL, "batch123@example.com", "earlier-workflow"
+        )
+
+        with patch(
+            "mailflow.commands.gmail_batch_workflows.process_email", new_callable=AsyncMock
+        ) as mock_process:
+            result = CliRunner().invoke(cli, ["batch", str(mail_dir)])
+
+        assert result.exit_code == 0, result.output
+        mock_process.assert_not_awaited()
+        assert "Already processed (earlier-workflow)" in result.output
+        assert "Processed: 0" in result.output
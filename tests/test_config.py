@@ -76,11 +76,9 @@ max_suggestions = 10
         config_file = Path(temp_config_dir) / "config.toml"
         config_file.write_text('[archive\nbase_path = "broken"')
 
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(ConfigurationError, match="Invalid TOML"):
             Config(config_dir=temp_config_dir)
 
-        assert "Invalid TOML" in str(exc_info.value)
-
     def test_valid_config_loaded_correctly(self, temp_config_dir):
         """Test that valid config is loaded correctly."""
         config_file = Path(temp_config_dir) / "config.toml"
@@ -121,11 +119,9 @@ class TestArchivistPreflight:
         """Test preflight fails when database_url is missing."""
         config = Config(config_dir=temp_config_dir)
 
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(ConfigurationError, match=r"archivist\.database_url"):
             config.preflight_archivist()
 
-        assert "archivist.database_url" in str(exc_info.value)
-
     def test_preflight_missing_db_schema(self, temp_config_dir):
         """Test preflight fails when db_schema is missing."""
         config_file = Path(temp_config_dir) / "config.toml"
@@ -136,11 +132,9 @@ database_url = "postgresql://localhost/test"
 
         config = Config(config_dir=temp_config_dir)
 
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(ConfigurationError, match=r"archivist\.db_schema"):
             config.preflight_archivist()
 
-        assert "archivist.db_schema" in str(exc_info.value)
-
     def test_preflight_passes_with_all_required(self, temp_config_dir):
         """Test preflight passes when all required settings present."""
         config_file = Path(temp_config_dir) / "config.toml"
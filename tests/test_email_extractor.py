@@ -1,3 +1,9 @@
+import base64
+import sys
+from unittest.mock import patch
+
+import pytest
+
 from mailflow.email_extractor import EmailExtractor
 
 
@@ -46,115 +52,129 @@ class TestEmailExtractor:
         assert features["has_attachments"] is True
         assert features["num_attachments"] == 1
 
-    def test_clean_subject(self):
+    @pytest.mark.parametrize(
+        "subject, expected",
+        [
+            pytest.param("Test/Subject", "Test-Subject", id="slash"),
+            pytest.param("Test[Subject]", "Test(Subject)", id="brackets"),
+            pytest.param("  Test Subject  ", "Test Subject", id="surrounding-whitespace"),
+        ],
+    )
+    def test_clean_subject(self, subject, expected):
         extractor = EmailExtractor()
 
-        # Test replacing special characters
-        assert extractor._clean_subject("Test/Subject") == "Test-Subject"
-        assert extractor._clean_subject("Test[Subject]") == "Test(Subject)"
-        assert extractor._clean_subject("  Test Subject  ") == "Test Subject"
+        assert extractor._clean_subject(subject) == expected
 
-    def test_extract_from_domain(self):
+    def test_html_to_text_regex_fallback(self):
+        """Without html2text, scripts and styles are dropped and tags stripped"""
         extractor = EmailExtractor()
-
-        # Test various from formats
-        test_cases = [
-            ("user@example.com", "example.com"),
-            ("User Name <user@example.com>", "example.com"),
-            ('"User Name" <user@example.com>', "example.com"),
-            ("user@subdomain.example.com", "subdomain.example.com"),
-        ]
-
-        for from_addr, expected_domain in test_cases:
-            email_text = f"""From: {from_addr}
+        html = (
+            "<html><head><STYLE>p { color: red; }</STYLE></head>"
+            "<body><p>Invoice\n  total</p><script type='x'>alert(1)</script><b>42</b></body></html>"
+        )
+
+        with patch.dict(sys.modules, {"html2text": None}):
+            text = extractor._html_to_text(html)
+
+        assert text == "Invoice total 42"
+
+    @pytest.mark.parametrize(
+        "from_addr, expected_domain",
+        [
+            pytest.param("user@example.com", "example.com", id="bare"),
+            pytest.param("User Name <user@example.com>", "example.com", id="display-name"),
+            pytest.param('"User Name" <user@example.com>', "example.com", id="quoted-name"),
+            pytest.param("user@subdomain.example.com", "subdomain.example.com", id="subdomain"),
+        ],
+    )
+    def test_extract_from_domain(self, from_addr, expected_domain):
+        extractor = EmailExtractor()
+        email_text = f"""From: {from_addr}
 To: test@test.com
 Subject: Test
 Message-ID: <test@test.com>
 
 Test body
 """
-            result = extractor.extract(email_text)
-            assert result["features"]["from_domain"] == expected_domain
-
-    def test_header_injection_subject(self):
+        result = extractor.extract(email_text)
+        assert result["features"]["from_domain"] == expected_domain
+
+    @pytest.mark.parametrize(
+        "malicious_subject",
+        [
+            pytest.param("Normal Subject\nInjected: Header", id="lf"),
+            pytest.param("Normal Subject\r\nInjected: Header", id="crlf"),
+            pytest.param("Normal\nSubject\r\nWith\nMultiple\nLines", id="multiple-lines"),
+            pytest.param("Subject with\x00null bytes", id="null-byte"),
+        ],
+    )
+    def test_header_injection_subject(self, malicious_subject):
         """Test that newlines and carriage returns are sanitized immediately after decoding"""
         extractor = EmailExtractor()
-
-        # Test injection attempts in subject
-        injection_attempts = [
-            "Normal Subject\nInjected: Header",
-            "Normal Subject\r\nInjected: Header",
-            "Normal\nSubject\r\nWith\nMultiple\nLines",
-            "Subject with\x00null bytes",
-        ]
-
-        for malicious_subject in injection_attempts:
-            email_text = f"""From: test@example.com
+        email_text = f"""From: test@example.com
 To: user@test.com
 Subject: {malicious_subject}
 Message-ID: <test@test.com>
 
 Test body
 """
-            result = extractor.extract(email_text)
-
-            # Newlines and carriage returns should be replaced with spaces
-            assert "\n" not in result["subject"]
-            assert "\r" not in result["subject"]
-            # Null bytes should be removed
-            assert "\x00" not in result["subject"]
+        result = extractor.extract(email_text)
 
-    def test_header_injection_from_address(self):
+        # Newlines and carriage returns should be replaced with spaces
+        assert "\n" not in result["subject"]
+        assert "\r" not in result["subject"]
+        # Null bytes should be removed
+        assert "\x00" not in result["subject"]
+
+    @pytest.mark.parametrize(
+        "malicious_from",
+        [
+            pytest.param("attacker@evil.com\nBcc: victim@target.com", id="lf"),
+            pytest.param("attacker@evil.com\r\nBcc: victim@target.com", id="crlf"),
+            pytest.param("Name\nInjected <attacker@evil.com>", id="display-name"),
+        ],
+    )
+    def test_header_injection_from_address(self, malicious_from):
         """Test that from addresses are sanitized to prevent header injection"""
         extractor = EmailExtractor()
-
-        injection_attempts = [
-            "attacker@evil.com\nBcc: victim@target.com",
-            "attacker@evil.com\r\nBcc: victim@target.com",
-            "Name\nInjected <attacker@evil.com>",
-        ]
-
-        for malicious_from in injection_attempts:
-            email_text = f"""From: {malicious_from}
+        email_text = f"""From: {malicious_from}
 To: user@test.com
 Subject: Test
 Message-ID: <test@test.com>
 
 Test body
 """
-            result = extractor.extract(email_text)
+        result = extractor.extract(email_text)
 
-            # Newlines and carriage returns should be sanitized
-            assert "\n" not in result["from"]
-            assert "\r" not in result["from"]
+        # Newlines and carriage returns should be sanitized
+        assert "\n" not in result["from"]
+        assert "\r" not in result["from"]
 
-    def test_header_injection_to_address(self):
+    @pytest.mark.parametrize(
+        "malicious_to",
+        [
+            pytest.param("user@test.com\nBcc: victim@target.com", id="lf"),
+            pytest.param("user@test.com\r\nBcc: victim@target.com", id="crlf"),
+        ],
+    )
+    def test_header_injection_to_address(self, malicious_to):
         """Test that to addresses are sanitized to prevent header injection"""
         extractor = EmailExtractor()
-
-        injection_attempts = [
-            "user@test.com\nBcc: victim@target.com",
-            "user@test.com\r\nBcc: victim@target.com",
-        ]
-
-        for malicious_to in injection_attempts:
-            email_text = f"""From: test@example.com
+        email_text = f"""From: test@example.com
 To: {malicious_to}
 Subject: Test
 Message-ID: <test@test.com>
 
 Test body
 """
-            result = extractor.extract(email_text)
+        result = extractor.extract(email_text)
 
-            # Newlines and carriage returns should be sanitized
-            assert "\n" not in result["to"]
-            assert "\r" not in result["to"]
+        # Newlines and carriage returns should be sanitized
+        assert "\n" not in result["to"]
+        assert "\r" not in result["to"]
 
     def test_mime_encoded_header_injection(self):
         """Test that MIME-encoded headers with injection attempts are sanitized"""
-        import base64
-
         extractor = EmailExtractor()
 
         # Create MIME-encoded subject with newline injection
@@ -179,8 +199,6 @@ Test body
 
     def test_mime_encoded_address_injection(self):
         """Test that MIME-encoded addresses with injection attempts are sanitized"""
-        import base64
-
         extractor = EmailExtractor()
 
         # Create MIME-encoded from address with newline injection
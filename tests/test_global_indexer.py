@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
 from pathlib import Path
 
+import pytest
+
 from docflow_archive import RepositoryConfig, RepositoryWriter
 from mailflow.indexer import run_indexer
 from mailflow.global_index import GlobalIndex
@@ -31,3 +33,45 @@ def test_indexer_builds_global_indexes(tmp_path):
     gi = GlobalIndex(str(base / "indexes"))
     results = list(gi.search("invoice", limit=5, entity="acme"))
     assert results and results[0]["filename"].endswith(".pdf")
+
+
+def _doc_data(rel_path: str) -> dict:
+    return {
+        "entity": "acme",
+        "date": "2025-11-05",
+        "filename": Path(rel_path).name,
+        "rel_path": rel_path,
+        "hash": None,
+        "size": 1,
+        "type": "pdf",
+        "source": "email",
+        "workflow": "invoices",
+        "category": None,
+        "confidence": None,
+        "origin_json": "{}",
+        "structured_json": None,
+    }
+
+
+def test_batch_commits_once_on_exit(tmp_path):
+    gi = GlobalIndex(str(tmp_path / "indexes"))
+
+    with gi.batch():
+        doc_id = gi.upsert_document(_doc_data("docs/2025/2025-11-05-invoice.pdf"))
+        gi.upsert_fts(doc_id, "2025-11-05-invoice.pdf", "Invoice", "billing@vendor.com", "invoice")
+        # Not visible to other connections until the batch commits
+        assert list(GlobalIndex(str(tmp_path / "indexes")).search("", entity="acme")) == []
+
+    results = list(gi.search("invoice", entity="acme"))
+    assert [r["id"] for r in results] == [doc_id]
+
+
+def test_batch_rolls_back_on_error(tmp_path):
+    gi = GlobalIndex(str(tmp_path / "indexes"))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        with gi.batch():
+            gi.upsert_document(_doc_data("docs/2025/2025-11-05-invoice.pdf"))
+            raise RuntimeError("boom")
+
+    assert list(gi.search("", entity="acme")) == []
@@ -33,11 +33,9 @@ database_url = "postgresql://localhost/docflow"
         """Test preflight_llmemory() raises error when not configured."""
         config = Config(config_dir=temp_config_dir)
 
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(ConfigurationError, match=r"llmemory\.database_url"):
             config.preflight_llmemory()
 
-        assert "llmemory.database_url" in str(exc_info.value)
-
     def test_preflight_llmemory_passes_when_configured(self, temp_config_dir):
         """Test preflight_llmemory() passes when configured."""
         config_file = Path(temp_config_dir) / "config.toml"
@@ -75,7 +73,7 @@ class TestIndexToLLMemoryFailFast:
         metadata_path = Path(temp_config_dir) / "test.json"
         metadata_path.write_text('{"id": "test-123"}')
 
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(ConfigurationError, match=r"llmemory\.database_url"):
             await index_to_llmemory(
                 config=config,
                 entity="test",
@@ -84,8 +82,6 @@ class TestIndexToLLMemoryFailFast:
                 metadata_path=metadata_path,
             )
 
-        assert "llmemory.database_url" in str(exc_info.value)
-
     def test_run_indexing_fails_fast_when_not_configured(self, temp_config_dir):
         """Test run_indexing raises ConfigurationError when llmemory not configured."""
         config = Config(config_dir=temp_config_dir)
@@ -96,7 +92,7 @@ class TestIndexToLLMemoryFailFast:
         metadata_path = Path(temp_config_dir) / "test.json"
         metadata_path.write_text('{"id": "test-123"}')
 
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(ConfigurationError, match=r"llmemory\.database_url"):
             run_indexing(
                 config=config,
                 entity="test",
@@ -105,8 +101,6 @@ class TestIndexToLLMemoryFailFast:
                 metadata_path=metadata_path,
             )
 
-        assert "llmemory.database_url" in str(exc_info.value)
-
 
 class TestIndexToLLMemoryIntegration:
     """Integration tests for llmemory indexing with real database."""
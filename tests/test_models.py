@@ -15,9 +15,17 @@ class TestWorkflowDefinition:
             postprocessors=["pdf-ocr"],
         )
 
-        assert workflow.name == "save-invoices"
-        assert workflow.kind == "document"
-        assert workflow.criteria["summary"] == "Save invoice PDFs"
+        assert workflow.to_dict() == {
+            "name": "save-invoices",
+            "kind": "document",
+            "criteria": {"summary": "Save invoice PDFs"},
+            "constraints": {"requires_evidence": ["invoice"]},
+            "handling": {
+                "archive": {"target": "document", "entity": "acme", "doctype": "invoice"},
+                "index": {"llmemory": False},
+            },
+            "postprocessors": ["pdf-ocr"],
+        }
         assert workflow.archive_entity == "acme"
         assert workflow.archive_doctype == "invoice"
         assert workflow.index_llmemory is False
@@ -104,7 +104,7 @@ class TestPDFConverter:
         receipts_dir = Path(temp_config_dir) / "receipts"
 
         # Should raise error without message object
-        with pytest.raises(WorkflowError) as exc_info:
+        with pytest.raises(WorkflowError, match="Message object is required"):
             save_email_as_pdf(
                 email_data,
                 directory=str(receipts_dir),
@@ -112,7 +112,6 @@ class TestPDFConverter:
                 use_year_dirs=False,
                 store_metadata=False,
             )
-        assert "Message object is required" in str(exc_info.value)
 
     def test_save_email_as_pdf_with_message_obj(self, temp_config_dir):
         """Test PDF conversion with Message object for better HTML extraction"""
@@ -157,15 +157,13 @@ Content-Type: text/html; charset=utf-8
             "features": {"from_domain": "example.com"},
         }
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Message object is required"):
             save_email_as_pdf(
                 email_data,
                 message_obj=None,  # No message object
                 directory=str(tmp_path),
             )
 
-        assert "Message object is required" in str(exc_info.value)
-
     def test_html_email_with_external_images(self):
         """Test that external images are preserved (not blocked)"""
         email_content = """From: sender@example.com
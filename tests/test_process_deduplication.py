@@ -155,3 +155,42 @@ class TestProcessDeduplication:
 
             tracker = ProcessedEmailsTracker(temp_config)
             assert not tracker.is_processed(sample_email, "<test123@example.com>")
+
+    async def test_process_reuses_pre_extracted_email_data(self, temp_config, sample_email):
+        """Test that pre-extracted data skips parsing and is not mutated"""
+        from mailflow.email_extractor import EmailExtractor
+
+        email_data = EmailExtractor().extract(sample_email)
+        original = dict(email_data)
+
+        with patch("mailflow.ui.WorkflowSelector.select_workflow", new_callable=AsyncMock) as mock_select:
+            mock_select.return_value = None
+
+            with patch("mailflow.process.EmailExtractor") as mock_extractor:
+                await process(
+                    sample_email,
+                    config=temp_config,
+                    context={"_position": 1},
+                    email_data=email_data,
+                )
+
+                mock_extractor.assert_not_called()
+
+            selected_data = mock_select.call_args.args[0]
+            assert selected_data["message_id"] == original["message_id"]
+            assert selected_data["_position"] == 1
+            assert email_data == original
+
+    async def test_process_reuses_given_data_store(self, temp_config, sample_email):
+        """Test that a caller-provided DataStore is used instead of reloading workflows"""
+        from mailflow.models import DataStore
+
+        data_store = DataStore(temp_config)
+
+        with patch("mailflow.ui.WorkflowSelector.select_workflow", new_callable=AsyncMock) as mock_select:
+            mock_select.return_value = None
+
+            with patch("mailflow.process.DataStore") as mock_data_store:
+                await process(sample_email, config=temp_config, data_store=data_store)
+
+                mock_data_store.assert_not_called()
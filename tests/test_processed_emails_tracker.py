@@ -1,10 +1,16 @@
 """Test processed emails tracking and deduplication"""
 
+import hashlib
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
 from mailflow.config import Config
+from mailflow.processed_emails_tracker import ProcessedEmailsTracker
+
+# Message-ID of the sample_email_content fixture
+MESSAGE_ID = "<test123@example.com>"
 
 
 @pytest.fixture
@@ -14,6 +20,12 @@ def temp_config():
     return Config(config_dir=temp_dir)
 
 
+@pytest.fixture
+def tracker(temp_config):
+    """Tracker backed by a fresh database in the temp config dir"""
+    return ProcessedEmailsTracker(temp_config)
+
+
 @pytest.fixture
 def sample_email_content():
     """Sample email content for testing"""
@@ -42,26 +54,18 @@ class TestProcessedEmailsTracker:
 
     def test_imports_tracker(self):
         """Test that we can import the tracker module"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
         assert ProcessedEmailsTracker is not None
 
     def test_tracker_initialization(self, temp_config):
         """Test tracker creates database and schema"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
         tracker = ProcessedEmailsTracker(temp_config)
 
         # Should create database file
         db_path = temp_config.config_dir / "processed_emails.db"
         assert db_path.exists()
 
-    def test_tracker_schema_creation(self, temp_config):
+    def test_tracker_schema_creation(self, tracker):
         """Test that tracker creates correct database schema"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
-        tracker = ProcessedEmailsTracker(temp_config)
-
         # Check that table exists
         with tracker.get_connection() as conn:
             result = conn.execute(
@@ -69,30 +73,21 @@ class TestProcessedEmailsTracker:
             )
             assert result.fetchone() is not None
 
-    def test_mark_as_processed_with_message_id(self, temp_config, sample_email_content):
+    def test_mark_as_processed_with_message_id(self, tracker, sample_email_content):
         """Test marking email as processed using message-id"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
-        tracker = ProcessedEmailsTracker(temp_config)
-
-        message_id = "<test123@example.com>"
         workflow_name = "test-workflow"
 
         tracker.mark_as_processed(
             email_content=sample_email_content,
-            message_id=message_id,
+            message_id=MESSAGE_ID,
             workflow_name=workflow_name,
         )
 
         # Verify it was recorded
-        assert tracker.is_processed(sample_email_content, message_id)
+        assert tracker.is_processed(sample_email_content, MESSAGE_ID)
 
-    def test_mark_as_processed_without_message_id(self, temp_config, sample_email_no_message_id):
+    def test_mark_as_processed_without_message_id(self, tracker, sample_email_no_message_id):
         """Test marking email as processed without message-id (uses content hash)"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
-        tracker = ProcessedEmailsTracker(temp_config)
-
         workflow_name = "test-workflow"
 
         tracker.mark_as_processed(
@@ -102,29 +97,19 @@ class TestProcessedEmailsTracker:
         # Should be detected as processed by content hash
         assert tracker.is_processed(sample_email_no_message_id, None)
 
-    def test_is_processed_with_message_id(self, temp_config, sample_email_content):
+    def test_is_processed_with_message_id(self, tracker, sample_email_content):
         """Test checking if email is processed using message-id"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
-        tracker = ProcessedEmailsTracker(temp_config)
-
-        message_id = "<test123@example.com>"
-
         # Not processed yet
-        assert not tracker.is_processed(sample_email_content, message_id)
+        assert not tracker.is_processed(sample_email_content, MESSAGE_ID)
 
         # Mark as processed
-        tracker.mark_as_processed(sample_email_content, message_id, "workflow1")
+        tracker.mark_as_processed(sample_email_content, MESSAGE_ID, "workflow1")
 
         # Should be detected
-        assert tracker.is_processed(sample_email_content, message_id)
+        assert tracker.is_processed(sample_email_content, MESSAGE_ID)
 
-    def test_is_processed_with_content_hash_only(self, temp_config, sample_email_no_message_id):
+    def test_is_processed_with_content_hash_only(self, tracker, sample_email_no_message_id):
         """Test checking if email is processed using content hash when no message-id"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
-        tracker = ProcessedEmailsTracker(temp_config)
-
         # Not processed yet
         assert not tracker.is_processed(sample_email_no_message_id, None)
 
@@ -134,38 +119,24 @@ class TestProcessedEmailsTracker:
         # Should be detected by content hash
         assert tracker.is_processed(sample_email_no_message_id, None)
 
-    def test_duplicate_message_id_same_content(self, temp_config, sample_email_content):
+    def test_duplicate_message_id_same_content(self, tracker, sample_email_content):
         """Test that same message-id is detected as duplicate"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
-        tracker = ProcessedEmailsTracker(temp_config)
-
-        message_id = "<test123@example.com>"
-
         # Process once
-        tracker.mark_as_processed(sample_email_content, message_id, "workflow1")
+        tracker.mark_as_processed(sample_email_content, MESSAGE_ID, "workflow1")
 
         # Try to process again with same message-id
-        assert tracker.is_processed(sample_email_content, message_id)
+        assert tracker.is_processed(sample_email_content, MESSAGE_ID)
 
-    def test_duplicate_content_different_message_id(self, temp_config, sample_email_content):
+    def test_duplicate_content_different_message_id(self, tracker, sample_email_content):
         """Test that identical content with different message-id is detected"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
-        tracker = ProcessedEmailsTracker(temp_config)
-
         # Process with first message-id
         tracker.mark_as_processed(sample_email_content, "<msg1@test.com>", "workflow1")
 
         # Same content, different message-id - should detect by content hash
         assert tracker.is_processed(sample_email_content, "<msg2@test.com>")
 
-    def test_get_statistics(self, temp_config, sample_email_content):
+    def test_get_statistics(self, tracker, sample_email_content):
         """Test getting tracker statistics"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
-        tracker = ProcessedEmailsTracker(temp_config)
-
         # Process a few emails
         tracker.mark_as_processed(sample_email_content, "<msg1@test.com>", "workflow1")
         tracker.mark_as_processed(sample_email_content + "\nExtra", "<msg2@test.com>", "workflow2")
@@ -176,28 +147,19 @@ class TestProcessedEmailsTracker:
         assert "workflow1" in stats["by_workflow"]
         assert "workflow2" in stats["by_workflow"]
 
-    def test_force_reprocess(self, temp_config, sample_email_content):
+    def test_force_reprocess(self, tracker, sample_email_content):
         """Test that we can get info about processed email for force reprocessing"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
-        tracker = ProcessedEmailsTracker(temp_config)
-
-        message_id = "<test123@example.com>"
-        tracker.mark_as_processed(sample_email_content, message_id, "workflow1")
+        tracker.mark_as_processed(sample_email_content, MESSAGE_ID, "workflow1")
 
         # Get info about the processed email
-        info = tracker.get_processed_info(sample_email_content, message_id)
+        info = tracker.get_processed_info(sample_email_content, MESSAGE_ID)
 
         assert info is not None
         assert info["workflow_name"] == "workflow1"
         assert "processed_at" in info
 
-    def test_content_hash_calculation(self, temp_config):
+    def test_content_hash_calculation(self, tracker):
         """Test that content hash is deterministic"""
-        from mailflow.processed_emails_tracker import ProcessedEmailsTracker
-
-        tracker = ProcessedEmailsTracker(temp_config)
-
         content1 = "Test email content"
         content2 = "Test email content"
         content3 = "Different content"
@@ -214,3 +176,39 @@ class TestProcessedEmailsTracker:
 
         # Hash should be hex string
         assert len(hash1) == 64  # SHA-256 produces 64 hex chars
+
+    def test_content_hash_of_none_raises(self, tracker):
+        """Test that a fresh tracker's hash cache does not swallow a None content"""
+        with pytest.raises(AttributeError):
+            tracker._calculate_content_hash(None)
+
+    def test_check_then_mark_hashes_content_once(self, tracker, sample_email_no_message_id):
+        """Test that checking and marking the same email reuses its content hash"""
+        with patch(
+            "mailflow.processed_emails_tracker.hashlib.sha256", wraps=hashlib.sha256
+        ) as mock_sha256:
+            assert not tracker.is_processed(sample_email_no_message_id, None)
+            assert tracker.get_processed_info(sample_email_no_message_id, None) is None
+            tracker.mark_as_processed(sample_email_no_message_id, None, "workflow1")
+
+        assert mock_sha256.call_count == 1
+        assert tracker.is_processed(sample_email_no_message_id, None)
+
+    def test_get_processed_info_many(
+        self, tracker, sample_email_content, sample_email_no_message_id
+    ):
+        """Test bulk lookup matches per-email lookups and keeps input order"""
+        tracker.mark_as_processed(sample_email_content, MESSAGE_ID, "workflow1")
+        tracker.mark_as_processed(sample_email_no_message_id, None, "workflow2")
+
+        infos = tracker.get_processed_info_many(
+            [
+                ("unrelated content", "<other@example.com>"),
+                (sample_email_content, MESSAGE_ID),
+                (sample_email_no_message_id, None),
+            ]
+        )
+
+        assert infos[0] is None
+        assert infos[1]["workflow_name"] == "workflow1"
+        assert infos[2]["workflow_name"] == "workflow2"
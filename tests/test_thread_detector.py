@@ -1,6 +1,10 @@
 # ABOUTME: Tests for email thread detection using References and In-Reply-To headers.
 """Tests for email thread detection."""
 
+import dataclasses
+
+import pytest
+
 from mailflow.thread_detector import detect_threads, get_thread_info
 
 
@@ -55,3 +59,13 @@ class TestGetThreadInfo:
         threads = detect_threads(emails)
         info = get_thread_info(emails[0], threads)
         assert info.pdf_in_thread == 2  # PDF is in email 2
+
+    def test_thread_info_is_immutable(self):
+        emails = [
+            {"message_id": "<msg1@test.com>", "references": "", "date": "2025-01-01"},
+            {"message_id": "<msg2@test.com>", "references": "<msg1@test.com>", "date": "2025-01-02"},
+        ]
+        threads = detect_threads(emails)
+        info = get_thread_info(emails[1], threads)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.position = 1
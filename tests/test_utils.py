@@ -0,0 +1,249 @@
+# ABOUTME: Tests for common utility functions
+# ABOUTME: Covers file hashing and atomic file writes
+"""Tests for mailflow.utils"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mailflow import utils
+from mailflow.exceptions import DataError
+from mailflow.utils import (
+    atomic_json_write,
+    atomic_write,
+    calculate_file_hash,
+    write_original_file,
+)
+
+CREATED_AT = datetime(2025, 3, 4, 9, 30, tzinfo=UTC)
+
+
+@pytest.fixture(scope="module")
+def large_payload():
+    """10 MiB of random bytes, built once and shared by the large-file tests."""
+    return os.urandom(10 * 1024 * 1024)
+
+
+def _entry_names(directory):
+    """Names in a directory, including leftover .tmp files, without building Paths."""
+    with os.scandir(directory) as entries:
+        return sorted(entry.name for entry in entries)
+
+
+class TestAtomicWrite:
+    """Test atomic file writes"""
+
+    def test_writes_text(self, tmp_path):
+        target = tmp_path / "out.txt"
+
+        atomic_write(target, "hello", fsync=False)
+
+        assert target.read_text() == "hello"
+
+    def test_writes_bytes(self, tmp_path):
+        target = tmp_path / "out.bin"
+
+        atomic_write(target, b"\x00\x01", mode="wb", fsync=False)
+
+        assert target.read_bytes() == b"\x00\x01"
+
+    def test_writes_large_content_completely(self, tmp_path, large_payload):
+        target = tmp_path / "out.bin"
+
+        atomic_write(target, large_payload, mode="wb", fsync=False)
+
+        assert target.read_bytes() == large_payload
+
+    def test_writes_text_as_utf8(self, tmp_path):
+        target = tmp_path / "out.txt"
+
+        atomic_write(target, "año", fsync=False)
+
+        assert target.read_bytes() == "año".encode()
+
+    def test_replaces_existing_file(self, tmp_path):
+        target = tmp_path / "out.txt"
+        target.write_text("old")
+
+        atomic_write(target, "new", fsync=False)
+
+        assert target.read_text() == "new"
+
+    def test_creates_missing_parent_dirs(self, tmp_path):
+        target = tmp_path / "a" / "b" / "out.txt"
+
+        atomic_write(target, "nested", fsync=False)
+
+        assert target.read_text() == "nested"
+
+    def test_leaves_no_temp_files(self, tmp_path):
+        atomic_write(tmp_path / "out.txt", "content", fsync=False)
+
+        assert _entry_names(tmp_path) == ["out.txt"]
+
+    def test_failure_raises_data_error_and_cleans_up(self, tmp_path):
+        target = tmp_path / "out.txt"
+
+        with pytest.raises(DataError, match="Failed to write"):
+            atomic_write(target, b"bytes in text mode")
+
+        assert _entry_names(tmp_path) == []
+
+    def test_concurrent_writes_leave_one_complete_file(self, tmp_path):
+        target = tmp_path / "out.txt"
+        contents = [f"content_{i}" * 1000 for i in range(50)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda c: atomic_write(target, c, fsync=False), contents))
+
+        assert target.read_text() in contents
+        assert _entry_names(tmp_path) == ["out.txt"]
+
+    def test_fsync_by_default(self, tmp_path):
+        with patch("mailflow.utils._sync_data") as mock_sync:
+            atomic_write(tmp_path / "out.txt", "durable")
+
+        mock_sync.assert_called_once()
+
+    def test_fsync_disabled(self, tmp_path):
+        target = tmp_path / "out.txt"
+
+        with patch("mailflow.utils._sync_data") as mock_sync:
+            atomic_write(target, "fast", fsync=False)
+
+        mock_sync.assert_not_called()
+        assert target.read_text() == "fast"
+
+    def test_sync_failure_raises_data_error_and_cleans_up(self, tmp_path):
+        with patch("mailflow.utils._sync_data", side_effect=OSError("disk full")):
+            with pytest.raises(DataError, match="disk full"):
+                atomic_write(tmp_path / "out.txt", "durable")
+
+        assert _entry_names(tmp_path) == []
+
+    def test_json_write_passes_fsync(self, tmp_path):
+        with patch("mailflow.utils._sync_data") as mock_sync:
+            atomic_json_write(tmp_path / "data.json", {"a": 1}, fsync=False)
+
+        mock_sync.assert_not_called()
+
+    def test_json_write(self, tmp_path):
+        target = tmp_path / "data.json"
+
+        atomic_json_write(target, {"b": 1, "a": [1, 2]}, fsync=False)
+
+        assert json.loads(target.read_text()) == {"a": [1, 2], "b": 1}
+        assert target.read_text().startswith('{\n  "a"')
+
+
+class TestCalculateFileHash:
+    """Test file hashing"""
+
+    @pytest.mark.parametrize(
+        "data, algorithm",
+        [
+            pytest.param(b"attachment payload\n" * 100, "sha256", id="sha256"),
+            pytest.param(b"abc", "md5", id="alternate-algorithm"),
+            pytest.param(b"", "sha256", id="empty-file"),
+            pytest.param(bytes(range(256)), "sha256", id="binary"),
+        ],
+    )
+    def test_matches_hashlib(self, tmp_path, data, algorithm):
+        path = tmp_path / "file.bin"
+        path.write_bytes(data)
+
+        assert calculate_file_hash(path, algorithm) == hashlib.new(algorithm, data).hexdigest()
+
+    def test_large_file_spans_multiple_reads(self, tmp_path, large_payload):
+        # Larger than file_digest's internal buffer, so the streaming loop runs
+        path = tmp_path / "big.bin"
+        path.write_bytes(large_payload)
+
+        assert calculate_file_hash(path) == hashlib.sha256(large_payload).hexdigest()
+
+
+class TestWriteOriginalFile:
+    """Test writing original files into the archive"""
+
+    def test_writes_under_entity_originals_year(self, tmp_path):
+        out = write_original_file(str(tmp_path), "acme", CREATED_AT, "invoice.pdf", b"%PDF")
+
+        assert out == str(tmp_path.resolve() / "acme" / "originals" / "2025" / "invoice.pdf")
+        assert Path(out).read_bytes() == b"%PDF"
+
+    def test_expands_user_in_base_path(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        out = write_original_file("~/Archive", "acme", CREATED_AT, "a.txt", b"a")
+
+        assert Path(out).parent == tmp_path.resolve() / "Archive" / "acme" / "originals" / "2025"
+
+    def test_relative_base_path_follows_working_directory(self, tmp_path, monkeypatch):
+        for name in ("one", "two"):
+            (tmp_path / name).mkdir()
+            monkeypatch.chdir(tmp_path / name)
+
+            out = write_original_file("Archive", "acme", CREATED_AT, "a.txt", b"a")
+
+            assert Path(out).is_relative_to((tmp_path / name).resolve())
+
+    def test_prefix_date(self, tmp_path):
+        out = write_original_file(
+            str(tmp_path), "acme", CREATED_AT, "invoice.pdf", b"%PDF", prefix_date=True
+        )
+
+        assert Path(out).name == "2025-03-04-invoice.pdf"
+
+    def test_prefix_date_not_doubled(self, tmp_path):
+        out = write_original_file(
+            str(tmp_path), "acme", CREATED_AT, "2025-03-04-invoice.pdf", b"x", prefix_date=True
+        )
+
+        assert Path(out).name == "2025-03-04-invoice.pdf"
+
+    def test_missing_created_at_uses_current_year(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(utils, "_now", lambda: datetime(2031, 6, 1))
+
+        out = write_original_file(str(tmp_path), "acme", None, "a.txt", b"a", prefix_date=True)
+
+        assert Path(out).parent.name == "2031"
+        assert Path(out).name == "a.txt"
+
+    def test_reuses_existing_year_dir_without_mkdir(self, tmp_path):
+        write_original_file(str(tmp_path), "acme", CREATED_AT, "a.txt", b"a")
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            write_original_file(str(tmp_path), "acme", CREATED_AT, "b.txt", b"b")
+
+        mock_mkdir.assert_not_called()
+
+    def test_collisions_get_numeric_suffix(self, tmp_path):
+        paths = [
+            write_original_file(str(tmp_path), "acme", CREATED_AT, "scan.pdf", bytes([n]))
+            for n in range(3)
+        ]
+
+        assert [Path(p).name for p in paths] == ["scan.pdf", "scan-2.pdf", "scan-3.pdf"]
+        assert [Path(p).read_bytes() for p in paths] == [b"\x00", b"\x01", b"\x02"]
+
+    def test_concurrent_writers_never_share_a_name(self, tmp_path):
+        def write(n):
+            return write_original_file(
+                str(tmp_path), "acme", CREATED_AT, "scan.pdf", n.to_bytes(2, "big")
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = list(executor.map(write, range(100)))
+
+        written = sorted(int.from_bytes(Path(p).read_bytes(), "big") for p in paths)
+        assert len(set(paths)) == 100
+        assert written == list(range(100))
+
+    def test_unwritable_name_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            write_original_file(str(tmp_path), "acme", CREATED_AT, "missing/a.txt", b"a")
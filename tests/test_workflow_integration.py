@@ -213,3 +213,19 @@ class TestWorkflowIntegration:
             content_path = Path(doc["content_path"])
             assert content_path.exists()
             assert content_path.suffix == ".pdf"
+
+
+class TestWriterCache:
+    def test_writer_cache_is_keyed_on_expanded_home(self, tmp_path, monkeypatch):
+        """Changing HOME must not hand back a writer bound to the old home"""
+        from mailflow.workflow import _cached_writer, _get_writer
+
+        _cached_writer.cache_clear()
+        monkeypatch.setenv("HOME", str(tmp_path / "alice"))
+        first = _get_writer("~/Archive", "acme")
+        monkeypatch.setenv("HOME", str(tmp_path / "bob"))
+        second = _get_writer("~/Archive", "acme")
+
+        assert first is not second
+        assert _get_writer("~/Archive", "acme") is second
+        _cached_writer.cache_clear()